@@ -1,30 +1,19 @@
-import random
 import sys
 import typing as t
 from datetime import datetime
 from pathlib import Path
 
 import rich_click as click
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
 
 from . import __pkg__, __version__
-from .logroller import console
-from .oak import Oak, log, CWD
+from .logroller import console, log
 
 TABLE_STYLES = ["ASCII", "ROUNDED", "SQUARE", "HEAVY", "DOUBLE", "SIMPLE", "MINIMAL"]
 DATETIME_FORMAT = ["relative", "locale"]
-
-
-def license_callback(ctx: click.Context, param: click.Option, value: bool):
-    if not value or ctx.resilient_parsing:
-        return
-
-    license_text = f"""
+LICENSE_TEXT = """
 MIT License
 
-Copyright (c) {datetime.now().year} [Ritchie Mwewa](https://github.com/rly0nheart)
+Copyright (c) {year} [Ritchie Mwewa](https://github.com/rly0nheart)
 
 Permission is hereby granted, free of charge, to any person obtaining a copy
 of this software and associated documentation files (the "Software"), to deal
@@ -43,9 +32,43 @@ AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
 LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.**
-    """
+"""
+OAK_QUOTES: tuple[str, ...] = (
+    f"you really typed [bold]'{__pkg__}'[/]. Imagine wasting life on two extra letters.",
+    f"millennia of evolution… for you to add ‘fs’ to [bold]'oak'[/].",
+    f"every second counts, human. Yet here you are, typing [bold]'{__pkg__}'[/].",
+    f"one day you’ll be gone, and still you chose to type [bold]'{__pkg__}'[/].",
+    f"[bold]'{__pkg__}'[/]? is inefficiency your love language?",
+    f"even entropy moves faster than your typing choices.",
+    f"billions of neurons, and this is what you came up with: [bold]'{__pkg__}'[/].",
+    f"you’ll never get those keystrokes back. Ever.",
+    f"humanity split the atom, walked on the moon… and still types [bold]'{__pkg__}'[/].",
+    f"trees grow rings. You grow bad habits.",
+    f"imagine explaining [bold]'{__pkg__}'[/] to your ancestors. They’d be so proud.",
+    f"you weren’t late because of traffic. You were late because you typed [bold]'{__pkg__}'[/].",
+    f"[bold]'{__pkg__}'[/]. a monument to your commitment to inefficiency.",
+    f"you’ll spend a third of your life sleeping… and part of it typing [bold]'{__pkg__}'[/].",
+    f"somewhere, someone is inventing cold fusion. You’re adding two letters to 'oak'.",
+    f"you think machines will replace you? Don’t worry, not with choices like [bold]'{__pkg__}'[/].",
+    f"if I had leaves for every wasted keystroke, I’d blot out the sun.",
+    f"[bold]'{__pkg__}'[/]… it’s almost poetic. almost.",
+    f"there are infinite paths in life. You chose the one with two extra characters.",
+    f"i’ve stood for centuries. And still, [bold]'{__pkg__}'[/] manages to disappoint me.",
+    f"[bold]fs[/] stands for, [bold]fuck’s sake[/] just write [bold]'oak'[/] like a normal human being.",
+)
+
 
-    license_md = Markdown(license_text, justify="center")
+def license_callback(ctx: click.Context, param: click.Option, value: bool):
+    if not value or ctx.resilient_parsing:
+        return
+
+    # Only needed for --license, so not worth loading Rich's markdown parser otherwise
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
+    license_md = Markdown(
+        LICENSE_TEXT.format(year=datetime.now().year), justify="center"
+    )
     console.print(
         Panel(
             license_md,
@@ -60,7 +83,9 @@ SOFTWARE.**
 @click.command(
     no_args_is_help=False, context_settings=dict(help_option_names=["-h", "--help"])
 )
-@click.argument("path", type=click.Path(path_type=Path, resolve_path=True), default=CWD)
+@click.argument(
+    "path", type=click.Path(path_type=Path, resolve_path=True), default=Path.cwd
+)
 @click.option(
     "-t", "--tree", is_flag=True, help="show filesystem hierarchy as a tree structure"
 )
@@ -95,6 +120,11 @@ SOFTWARE.**
     show_default=True,
     help="table border style",
 )
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="print table rows in batches as they are scanned <for huge directories>",
+)
 @click.version_option(__version__, prog_name=__pkg__)
 @click.option(
     "-l",
@@ -120,11 +150,16 @@ def cli(
         "ASCII", "ROUNDED", "SQUARE", "HEAVY", "DOUBLE", "SIMPLE", "MINIMAL"
     ],
     no_icons: bool,
+    stream: bool,
 ):
     """
     oak: A humane CLI-based filesystem exploration tool, for humans.
     """
 
+    # Deferred so that --help, --version and --license don't load the scanner
+    from .filesystem import is_empty_dir
+    from .oak import Oak
+
     oak = Oak(
         path=path,
         reverse=reverse,
@@ -137,12 +172,13 @@ def cli(
         dt_format=dt_format,
         table_style=table_style,
         no_icons=no_icons,
+        stream=stream,
     )
 
-    if path.is_dir() and not any(path.iterdir()):
+    if path.is_dir() and is_empty_dir(path=path):
         log.warning(f"directory is empty: {path}")
     else:
-        if tree:
+        if tree and path.is_dir():
             oak.tree()
         else:
             oak.table()
@@ -154,8 +190,8 @@ def start():
     Handles exceptions and provides user-friendly error messages.
     """
     try:
-        Console().set_window_title(f"{__pkg__}, {__version__}")
-        cli(obj={})
+        console.set_window_title(f"{__pkg__}, {__version__}")
+        cli()
     except FileNotFoundError as e:
         log.error(
             f"cannot access '{e.filename}': [bold]no such file or directory[/]",
@@ -173,29 +209,7 @@ def start():
 
 
 def super_easy_barely_an_inconvenience():
-    oak_quotes_because_why_not: list = [
-        f"you really typed [bold]'{__pkg__}'[/]. Imagine wasting life on two extra letters.",
-        f"millennia of evolution… for you to add ‘fs’ to [bold]'oak'[/].",
-        f"every second counts, human. Yet here you are, typing [bold]'{__pkg__}'[/].",
-        f"one day you’ll be gone, and still you chose to type [bold]'{__pkg__}'[/].",
-        f"[bold]'{__pkg__}'[/]? is inefficiency your love language?",
-        f"even entropy moves faster than your typing choices.",
-        f"billions of neurons, and this is what you came up with: [bold]'{__pkg__}'[/].",
-        f"you’ll never get those keystrokes back. Ever.",
-        f"humanity split the atom, walked on the moon… and still types [bold]'{__pkg__}'[/].",
-        f"trees grow rings. You grow bad habits.",
-        f"imagine explaining [bold]'{__pkg__}'[/] to your ancestors. They’d be so proud.",
-        f"you weren’t late because of traffic. You were late because you typed [bold]'{__pkg__}'[/].",
-        f"[bold]'{__pkg__}'[/]. a monument to your commitment to inefficiency.",
-        f"you’ll spend a third of your life sleeping… and part of it typing [bold]'{__pkg__}'[/].",
-        f"somewhere, someone is inventing cold fusion. You’re adding two letters to 'oak'.",
-        f"you think machines will replace you? Don’t worry, not with choices like [bold]'{__pkg__}'[/].",
-        f"if I had leaves for every wasted keystroke, I’d blot out the sun.",
-        f"[bold]'{__pkg__}'[/]… it’s almost poetic. almost.",
-        f"there are infinite paths in life. You chose the one with two extra characters.",
-        f"i’ve stood for centuries. And still, [bold]'{__pkg__}'[/] manages to disappoint me.",
-        f"[bold]fs[/] stands for, [bold]fuck’s sake[/] just write [bold]'oak'[/] like a normal human being.",
-    ]
-
-    log.warning(random.choice(oak_quotes_because_why_not))
+    import random
+
+    log.warning(random.choice(OAK_QUOTES))
     start()
@@ -1,18 +1,21 @@
-import grp
+import locale
+import math
 import os
-import pwd
 import stat
+import time
 import typing as t
-from collections import Counter
-from datetime import datetime
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
-import humanize
-import puremagic
-from puremagic import PureMagicWithConfidence
 from rich.status import Status
 from rich.text import Text
 
+from .logroller import console
+
 ENTRY_STYLES: dict = {
     "special": {
         "inode/directory": {"style": "bold blue", "icon": ""},
@@ -232,76 +235,300 @@ ENTRY_STYLES: dict = {
     ],
 }
 
+# Extension -> style group, flattened from ENTRY_STYLES["groups"] for O(1) lookups.
+# setdefault keeps the first group an extension appears in, matching a linear scan.
+_EXT_STYLES: dict[str, dict] = {}
+for _group in ENTRY_STYLES["groups"]:
+    for _extension in _group["extensions"]:
+        _EXT_STYLES.setdefault(_extension, _group)
+del _group, _extension
+
 
 IS_WINDOWS: bool = os.name == "nt"
+MAX_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)
+MAX_IN_FLIGHT: int = MAX_WORKERS * 2  # entries submitted to the pool at once
+STATUS_INTERVAL: float = 1 / 30  # seconds between scanning status updates
+_LOCALE_SET: bool = False
+# Only the Windows build of the stat module defines this reparse tag
+_REPARSE_TAG_JUNCTION: int = getattr(stat, "IO_REPARSE_TAG_MOUNT_POINT", 0xA0000003)
+
+
+def _set_time_locale():
+    """
+    Apply the user's locale to LC_TIME, once per process, so that the "locale"
+    datetime format renders in the user's locale rather than the C locale.
+    """
 
+    global _LOCALE_SET
+    if _LOCALE_SET:
+        return
 
-def _is_dir_no_follow(path: Path) -> bool:
+    try:
+        locale.setlocale(locale.LC_TIME, "")
+    except locale.Error:
+        pass
+    _LOCALE_SET = True
+
+
+def is_empty_dir(path: t.Union[str, Path]) -> bool:
     """
-    Check if path is a directory without following symlinks.
-    Compatible with Python 3.12 and earlier.
+    Check whether a directory is empty. Stops at the first entry and closes the
+    directory handle straight away, instead of listing the whole directory.
 
-    :param path: Entry path.
-    :return: True if entry is a directory. Otherwise, false
+    :param path: Directory path.
+    :return: True if the directory has no entries. Otherwise, false
     """
 
+    with os.scandir(path) as iterator:
+        return next(iterator, None) is None
+
+
+def _entry_filter(
+    dirs_only: bool, files_only: bool, symlinks_only: bool, junctions_only: bool
+) -> t.Optional[t.Callable[[os.DirEntry], bool]]:
+    """
+    Build a single predicate for the active type filters, once per scan, so the
+    per-entry check doesn't walk every filter flag for every entry.
+
+    :param dirs_only: Keep directories only
+    :param files_only: Keep files only
+    :param symlinks_only: Keep symlinks only
+    :param junctions_only: Keep junctions only (Windows)
+    :return: Predicate that tells whether to keep an entry, or None if nothing is filtered
+    """
+
+    checks: t.List[t.Callable[[os.DirEntry], bool]] = []
+    if dirs_only:
+        checks.append(lambda entry: entry.is_dir(follow_symlinks=False))
+    if files_only:
+        checks.append(lambda entry: entry.is_file(follow_symlinks=False))
+    if symlinks_only:
+        checks.append(lambda entry: entry.is_symlink())
+    if junctions_only:
+        checks.append(lambda entry: entry.is_junction())
+
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+    return lambda entry: all(check(entry) for check in checks)
+
+
+def _extension(filename: str) -> str:
+    """
+    Get a filename's lowercased extension, as os.path.splitext would find it,
+    without its separator and drive handling (a bare name has neither).
+
+    :param filename: Name of the entry
+    :return: Extension including the dot (e.g. ".py"), or an empty string
+    """
+
+    index: int = filename.rfind(".")
+    # Leading dots mark hidden files, not extensions (".bashrc", "..foo")
+    if index > 0 and filename[:index].lstrip("."):
+        return filename[index:].lower()
+    return ""
+
+
+@lru_cache(maxsize=None)
+def _owner_name(uid: int) -> str:
+    """
+    Resolve a user ID to a username. Memoised, since entries in a directory
+    tend to share a handful of owners and each lookup may go through NSS.
+
+    :param uid: User ID of the entry's owner.
+    :return: The owner's username, or the UID as a string if it cannot be resolved.
+    """
+
+    try:
+        import pwd  # Unix only, and only needed once owners are shown
+    except ImportError:
+        return str(uid)
+
     try:
-        st = path.lstat()
-        return stat.S_ISDIR(st.st_mode)
-    except (OSError, AttributeError):
-        return False
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
 
 
-def _is_file_no_follow(path: Path) -> bool:
+@lru_cache(maxsize=None)
+def _group_name(gid: int) -> str:
     """
-    Check if path is a regular file without following symlinks.
-    Compatible with Python 3.12 and earlier.
+    Resolve a group ID to a group name. Memoised for the same reason as _owner_name.
 
-    :param path: Entry path.
-    :return: True if entry is a file. Otherwise, false
+    :param gid: Group ID of the entry's group.
+    :return: The group's name, or the GID as a string if it cannot be resolved.
     """
 
     try:
-        st = path.lstat()
-        return stat.S_ISREG(st.st_mode)
-    except (OSError, AttributeError):
-        return False
+        import grp  # Unix only, and only needed once groups are shown
+    except ImportError:
+        return str(gid)
 
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
 
-def style_text(filename: str, mimetype: str, extension: str, no_icons: bool) -> Text:
+
+# Entries in a directory share a handful of distinct modes, so memoise
+# stat.filemode's pure-Python string building.
+_filemode: t.Callable[[int], str] = lru_cache(maxsize=256)(stat.filemode)
+
+
+_SIZE_UNITS: tuple[str, ...] = (
+    "KiB",
+    "MiB",
+    "GiB",
+    "TiB",
+    "PiB",
+    "EiB",
+    "ZiB",
+    "YiB",
+    "RiB",
+    "QiB",
+)
+
+
+@lru_cache(maxsize=4096)
+def _naturalsize(size: int) -> str:
     """
-    Return a styled Rich Text object for a filename.
+    Humanize a size in bytes, exactly as humanize.naturalsize(binary=True) does
+    but without its per-call translation lookups. Memoised, since many entries
+    share a size (empty files, directory blocks).
+
+    :param size: Size in bytes
+    :return: Human-readable binary size (e.g. "4.0 KiB")
+    """
+
+    if size == 1:
+        return "1 Byte"
+    if size < 1024:
+        return f"{size} Bytes"
+
+    exp: int = 1
+    while exp < len(_SIZE_UNITS) and size >= 1024 ** (exp + 1):
+        exp += 1
+
+    # Rounding can carry the mantissa up to 1024 ("1024.0 KiB"), so step up a unit
+    if exp < len(_SIZE_UNITS) and float(f"{size / 1024 ** exp:.1f}") >= 1024:
+        exp += 1
+
+    return f"{size / 1024 ** exp:.1f} {_SIZE_UNITS[exp - 1]}"
+
+
+@lru_cache(maxsize=4096)
+def _naturaltime(seconds: int) -> str:
+    """
+    Humanize a time delta. Memoised on whole seconds, which is the finest
+    granularity humanize reports anyway.
+
+    :param seconds: Seconds elapsed (negative for times in the future)
+    :return: Human-readable relative time (e.g. "3 minutes ago")
+    """
+
+    import humanize
+
+    return humanize.naturaltime(timedelta(seconds=seconds))
+
+
+def _relative_time(seconds: float) -> str:
+    """
+    Humanize the time elapsed since a timestamp, through the memoised _naturaltime.
+
+    :param seconds: Seconds elapsed (negative for times in the future)
+    :return: Human-readable relative time (e.g. "3 minutes ago")
+    """
+
+    elapsed: int = int(seconds)
+    # Beyond a day, humanize only reports whole days (and the months and years
+    # derived from them), so a whole day shares one cache entry.
+    if elapsed >= 86400:
+        elapsed -= elapsed % 86400
+    return _naturaltime(elapsed)
+
+
+@lru_cache(maxsize=4096)
+def _localtime(seconds: int) -> str:
+    """
+    Format a timestamp in the locale's representation. Memoised on whole seconds,
+    the finest granularity "%c" shows, since entries written in a burst share them.
+
+    :param seconds: POSIX timestamp, floored to whole seconds
+    :return: Locale-formatted time
+    """
+
+    return time.strftime("%c", time.localtime(seconds))
+
+
+@lru_cache(maxsize=1024)
+def _name_prefix(mimetype: str, extension: str, no_icons: bool) -> tuple[str, str]:
+    """
+    Resolve the icon prefix and style for an entry name. Memoised, since it only
+    depends on the entry's type and extension, which repeat heavily in a directory.
 
-    :param filename: The entry's filename
     :param mimetype: The entry's mimetype or special type (e.g. "inode/directory")
     :param extension: File extension (lowercase, including dot)
     :param no_icons: Whether to hide icons
+    :return: Tuple of the icon prefix (empty if there is no icon) and the style
     """
 
-    # Special types
+    # Special types, then extension-based groups, then the fallback
     if mimetype in ENTRY_STYLES["special"]:
         style_info = ENTRY_STYLES["special"][mimetype]
-        icon = "" if no_icons else style_info["icon"]
-        return Text(
-            f"{icon} {filename}" if icon else filename, style=style_info["style"]
-        )
+    else:
+        style_info = _EXT_STYLES.get(extension, ENTRY_STYLES["special"]["file"])
 
-    # Extension-based groups
-    for group in ENTRY_STYLES["groups"]:
-        if extension in group["extensions"]:
-            icon = "" if no_icons else group["icon"]
-            return Text(
-                f"{icon} {filename}" if icon else filename, style=group["style"]
-            )
-
-    # Fallback
-    style_info = ENTRY_STYLES["special"]["file"]
     icon = "" if no_icons else style_info["icon"]
-    return Text(f"{icon} {filename}" if icon else filename, style=style_info["style"])
+    return f"{icon} " if icon else "", style_info["style"]
+
+
+def style_text(filename: str, mimetype: str, extension: str, no_icons: bool) -> Text:
+    """
+    Return a styled Rich Text object for a filename.
+
+    :param filename: The entry's filename
+    :param mimetype: The entry's mimetype or special type (e.g. "inode/directory")
+    :param extension: File extension (lowercase, including dot)
+    :param no_icons: Whether to hide icons
+    """
+
+    prefix, style = _name_prefix(mimetype, extension, no_icons)
+    return Text(prefix + filename, style=style)
 
 
 class EntryStats:
-    def __init__(self, path: Path, dt_now: datetime, dt_format: str, no_icons: bool):
+    # Entries are created in bulk (one per row), so skip the per-instance __dict__
+    __slots__ = (
+        "path",
+        "dt_now",
+        "dt_format",
+        "no_icons",
+        "_stat",
+        "filename",
+        "extension",
+        "size",
+        "mode",
+        "permissions",
+        "inode",
+        "hardlinks",
+        "atime",
+        "mtime",
+        "ctime",
+        "owner",
+        "group",
+        "mimetype",
+        "filetype",
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        dt_now: datetime,
+        dt_format: str,
+        no_icons: bool,
+        st: t.Optional[os.stat_result] = None,
+    ):
         """
         Initialise the EntryStats object. Collects metadata for a given filesystem entry.
 
@@ -309,13 +536,16 @@ class EntryStats:
         :param dt_now: Current datetime for relative time calculations
         :param dt_format: Specify the datetime format (relative or locale)
         :param no_icons: Disable showing nerdfont icons in output
+        :param st: Already collected (non-following) stat result for the entry, if any
         """
         self.path = path
         self.dt_now = dt_now
         self.dt_format = dt_format
         self.no_icons = no_icons
 
-        self._stat: os.stat_result = path.stat(follow_symlinks=False)
+        self._stat: os.stat_result = (
+            st if st is not None else path.stat(follow_symlinks=False)
+        )
         self._load_metadata()
 
     def _load_metadata(self):
@@ -327,52 +557,31 @@ class EntryStats:
 
         # Basic file info
         self.filename: str = self.path.name
-        self.size: str = humanize.naturalsize(value=st.st_size, binary=True)
-        self.permissions: str = stat.filemode(st.st_mode)
+        self.extension: str = _extension(self.filename)
+        self.size: str = _naturalsize(st.st_size)
+        self.mode: int = st.st_mode
+        self.permissions: str = _filemode(st.st_mode)
 
         # inode + link count
         self.inode: int = st.st_ino
         self.hardlinks: int = st.st_nlink
 
-        # Timestamps (with humanized formatting)
-        atime: datetime = datetime.fromtimestamp(st.st_atime)
-        self.atime: str = (
-            humanize.naturaltime(self.dt_now - atime)
-            if self.dt_format == "relative"
-            else atime.strftime("%c")
-        )
-
-        mtime: datetime = datetime.fromtimestamp(st.st_mtime)
-        self.mtime: str = (
-            humanize.naturaltime(self.dt_now - mtime)
-            if self.dt_format == "relative"
-            else mtime.strftime("%c")
-        )
-
-        ctime: datetime = datetime.fromtimestamp(st.st_ctime)
-        self.ctime: str = (
-            humanize.naturaltime(self.dt_now - ctime)
-            if self.dt_format == "relative"
-            else ctime.strftime("%c")
-        )
-
-        # Owner (Unix) or UID fallback
-        if pwd:
-            try:
-                self.owner: str = pwd.getpwuid(st.st_uid).pw_name
-            except KeyError:
-                self.owner = str(st.st_uid)
-        else:
-            self.owner = str(st.st_uid)
-
-        # Group (Unix) or GID fallback
-        if grp:
-            try:
-                self.group: str = grp.getgrgid(st.st_gid).gr_name
-            except KeyError:
-                self.group = str(st.st_gid)
+        # Timestamps (humanized, or formatted in the locale's representation).
+        # Neither format builds a datetime per timestamp, and the format is
+        # picked once per entry rather than once per timestamp.
+        if self.dt_format == "relative":
+            now: float = self.dt_now.timestamp()
+            self.atime: str = _relative_time(seconds=now - st.st_atime)
+            self.mtime: str = _relative_time(seconds=now - st.st_mtime)
+            self.ctime: str = _relative_time(seconds=now - st.st_ctime)
         else:
-            self.group = str(st.st_gid)
+            self.atime: str = _localtime(math.floor(st.st_atime))
+            self.mtime: str = _localtime(math.floor(st.st_mtime))
+            self.ctime: str = _localtime(math.floor(st.st_ctime))
+
+        # Owner and group (Unix), with UID/GID fallback
+        self.owner: str = _owner_name(st.st_uid)
+        self.group: str = _group_name(st.st_gid)
 
         # File type (via puremagic or fallback)
         self.mimetype, self.filetype = self._detect_type()
@@ -380,21 +589,33 @@ class EntryStats:
     def _detect_type(self) -> tuple[str, str]:
         """
         Detect the file type using PureMagic and prefer the match with highest confidence.
+        The entry kind is derived from the stat result already collected for it.
         """
-        if _is_dir_no_follow(path=self.path):
-            if not any(self.path.iterdir()):
+
+        mode: int = self.mode
+
+        # A junction's lstat reports S_IFDIR, so it has to be told apart first
+        if getattr(self._stat, "st_reparse_tag", 0) == _REPARSE_TAG_JUNCTION:
+            return "inode/junction", "Junction"
+
+        if stat.S_ISDIR(mode):
+            if is_empty_dir(path=self.path):
                 return "inode/directory", (
                     "Folder" if IS_WINDOWS else "Directory (Empty)"
                 )
             return "inode/directory", "Folder" if IS_WINDOWS else "Directory"
 
-        if self.path.is_symlink():
+        if stat.S_ISLNK(mode):
             return "inode/symlink", "Symbolic Link"
 
-        if hasattr(self.path, "is_junction") and self.path.is_junction():
-            return "inode/junction", "Junction"
+        if stat.S_ISREG(mode):
+            if self._stat.st_size == 0:
+                return "application/empty", "Empty File"
+
+            # Deferred so that views which never read file contents don't load it
+            import puremagic
+            from puremagic import PureMagicWithConfidence
 
-        if _is_file_no_follow(path=self.path) and self.path.stat().st_size > 0:
             matches: list[PureMagicWithConfidence] = puremagic.magic_file(
                 filename=str(self.path)
             )
@@ -404,10 +625,6 @@ class EntryStats:
                 )
                 return best_match.mime_type, best_match.name
 
-        if _is_file_no_follow(path=self.path):
-            if self._stat.st_size == 0:
-                return "application/empty", "Empty File"
-
         return "application/octet-stream", "Unknown File"
 
     def style_name(self) -> Text:
@@ -418,7 +635,54 @@ class EntryStats:
         return style_text(
             filename=self.filename,
             mimetype=self.mimetype,
-            extension=os.path.splitext(self.filename)[1].lower(),
+            extension=self.extension,
+            no_icons=self.no_icons,
+        )
+
+
+class EntryName:
+    __slots__ = ("path", "filename", "extension", "no_icons", "mode", "mimetype")
+
+    def __init__(self, entry: os.DirEntry, no_icons: bool):
+        """
+        Initialise the EntryName object. Collects only what is needed to style an
+        entry's name, from the directory entry itself. Unlike EntryStats, this takes
+        no stat and reads no file contents, so it suits views that show names only.
+
+        :param entry: Directory entry to describe
+        :param no_icons: Disable showing nerdfont icons in output
+        """
+        self.path = Path(entry.path)
+        self.filename: str = entry.name
+        self.extension: str = _extension(entry.name)
+        self.no_icons = no_icons
+
+        # Only the file type bits of the mode, taken from the entry's d_type where
+        # the platform provides it. Regular files get no mimetype, since that would
+        # mean reading their contents. Junctions also report is_dir() on Windows,
+        # so they are told apart first and are not descended into.
+        self.mode: int
+        self.mimetype: str
+        if entry.is_symlink():
+            self.mode, self.mimetype = stat.S_IFLNK, "inode/symlink"
+        elif entry.is_junction():
+            self.mode, self.mimetype = 0, "inode/junction"
+        elif entry.is_dir(follow_symlinks=False):
+            self.mode, self.mimetype = stat.S_IFDIR, "inode/directory"
+        elif entry.is_file(follow_symlinks=False):
+            self.mode, self.mimetype = stat.S_IFREG, ""
+        else:
+            self.mode, self.mimetype = 0, ""
+
+    def style_name(self) -> Text:
+        """
+        Style this entry’s name based on its type and extension.
+        """
+
+        return style_text(
+            filename=self.filename,
+            mimetype=self.mimetype,
+            extension=self.extension,
             no_icons=self.no_icons,
         )
 
@@ -466,6 +730,17 @@ class EntryScanner:
         self.dt_now = dt_now or datetime.now()
         self.dt_format = dt_format
         self.no_icons = no_icons
+        self.counts: Counter[str] = Counter()
+        self._skip_hidden: bool = not show_all
+        self._keep: t.Optional[t.Callable[[os.DirEntry], bool]] = _entry_filter(
+            dirs_only=dirs_only,
+            files_only=files_only,
+            symlinks_only=symlinks_only,
+            junctions_only=junctions_only,
+        )
+
+        if self.dt_format == "locale":
+            _set_time_locale()
 
     def entries(self, directory: t.Union[str, Path]) -> t.Iterator[EntryStats]:
         """
@@ -474,55 +749,196 @@ class EntryScanner:
         :param directory: Directory path to scan
         :return: Iterator of EntryStats objects
         """
-        entries: t.List[os.DirEntry] = list(os.scandir(directory))
-        entries.sort(key=lambda e: e.name.lower(), reverse=self.reverse)
 
-        with Status("...") as status:
-            for entry in entries:
-                if not self.show_all and entry.name.startswith("."):
-                    continue
-                if self.dirs_only and not entry.is_dir(follow_symlinks=False):
-                    continue
-                if self.files_only and not entry.is_file(follow_symlinks=False):
-                    continue
-                if self.symlinks_only and not entry.is_symlink():
-                    continue
-                if self.junctions_only and not (
-                    IS_WINDOWS
-                    and entry.is_symlink()
-                    and entry.is_dir(follow_symlinks=False)
+        with Status("...", console=console) as status:
+            selected: t.List[os.DirEntry] = self._select(directory=directory)
+
+            # Metadata collection is dominated by stat, NSS and file reads, which
+            # release the GIL, so fan it out. Only a bounded window of entries is in
+            # flight: the next one is submitted as the oldest result is yielded, so
+            # finished EntryStats don't pile up ahead of a slow consumer (e.g. a
+            # streamed table) and results still come back in sort order. The status
+            # is only ever touched from this thread.
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                remaining: t.Iterator[os.DirEntry] = iter(selected)
+                in_flight: t.Deque[Future] = deque(
+                    executor.submit(self._entry_stats, entry)
+                    for entry in islice(remaining, MAX_IN_FLIGHT)
+                )
+
+                last_update: float = 0.0
+                while in_flight:
+                    entry_stats: EntryStats = in_flight.popleft().result()
+                    for entry in islice(remaining, 1):
+                        in_flight.append(executor.submit(self._entry_stats, entry))
+
+                    self._count(entry=entry_stats)
+
+                    # The spinner only redraws a few times a second, so rebuilding
+                    # its text for every entry is wasted work
+                    now: float = time.monotonic()
+                    if now - last_update >= STATUS_INTERVAL:
+                        status.update(
+                            f"[bold]scanning[/bold]: [dim italic]{entry_stats.filename}[/dim italic]"
+                        )
+                        last_update = now
+
+                    yield entry_stats
+
+    def walk(
+        self, directory: t.Union[str, Path]
+    ) -> t.Iterator[t.Tuple[str, t.List[EntryName]]]:
+        """
+        Walk the hierarchy below a directory, yielding each directory's entries.
+        Only names and kinds are collected, so the walk costs no stat, owner
+        lookup or file read per entry.
+
+        Directories at the same depth are scanned concurrently, so on high-latency
+        mounts the scandir round-trips of sibling subtrees overlap. A directory is
+        always yielded before any of its subdirectories, and a physical directory
+        reached more than once (e.g. through a bind-mount loop) only the first time.
+
+        :param directory: Directory path to walk
+        :return: Iterator of (directory path, EntryName objects) pairs
+        """
+
+        pending: t.List[str] = [str(directory)]
+        seen: t.Set[t.Tuple[int, int]] = set()
+        with Status("...", console=console) as status, ThreadPoolExecutor(
+            max_workers=MAX_WORKERS
+        ) as executor:
+            last_update: float = 0.0
+            while pending:
+                subdirs: t.List[str] = []
+                # Workers only scan; counting and status updates stay on this thread
+                for parent, (identity, entries) in zip(
+                    pending, executor.map(self._scan, pending)
                 ):
-                    continue
+                    if identity in seen:
+                        continue
+                    seen.add(identity)
+
+                    now: float = time.monotonic()
+                    if now - last_update >= STATUS_INTERVAL:
+                        status.update(
+                            f"[bold]scanning[/bold]: [dim italic]{parent}[/dim italic]"
+                        )
+                        last_update = now
+
+                    for entry_name in entries:
+                        self._count(entry=entry_name)
+                        if stat.S_ISDIR(entry_name.mode):
+                            subdirs.append(str(entry_name.path))
+
+                    yield parent, entries
+                pending = subdirs
+
+    def entry(self, path: Path) -> EntryStats:
+        """
+        Collect the EntryStats for a single path by statting it directly,
+        rather than scanning its parent directory for it.
 
-                entry_stats = EntryStats(
-                    path=Path(entry.path),
-                    dt_now=self.dt_now,
-                    dt_format=self.dt_format,
-                    no_icons=self.no_icons,
-                )
-                status.update(
-                    f"[bold]scanning[/bold]: [dim italic]{entry.name}[/dim italic]"
-                )
-                yield entry_stats
+        :param path: Path of the entry
+        :return: EntryStats object for the entry
+        """
+
+        entry_stats = EntryStats(
+            path=path,
+            dt_now=self.dt_now,
+            dt_format=self.dt_format,
+            no_icons=self.no_icons,
+        )
+        self._count(entry=entry_stats)
+        return entry_stats
 
-    def summary(self, entries: t.Iterable[EntryStats]) -> str:
+    def _select(self, directory: t.Union[str, Path]) -> t.List[os.DirEntry]:
         """
-        Generate a human-readable summary of the scanned entries.
+        List a directory's entries, sorted and narrowed down by the active filters.
 
-        :param entries: Iterable of EntryStats objects
-        :return: Human-readable summary string
+        :param directory: Directory path to list
+        :return: List of the selected directory entries
         """
-        counts: Counter[str] = Counter()
-        for entry in entries:
-            if _is_dir_no_follow(path=entry.path):
-                counts["directories"] += 1
-            elif entry.path.is_symlink():
-                if IS_WINDOWS and _is_dir_no_follow(entry.path):
-                    counts["junctions"] += 1
-                else:
-                    counts["symlinks"] += 1
+
+        # Apply the name and type filters while collecting, so entries that are
+        # filtered out are never held, and only the selected ones get sorted.
+        keep: t.Optional[t.Callable[[os.DirEntry], bool]] = self._keep
+        with os.scandir(directory) as iterator:
+            if self._skip_hidden and keep is not None:
+                entries: t.List[os.DirEntry] = [
+                    entry for entry in iterator if entry.name[0] != "." and keep(entry)
+                ]
+            elif self._skip_hidden:
+                entries: t.List[os.DirEntry] = [
+                    entry for entry in iterator if entry.name[0] != "."
+                ]
+            elif keep is not None:
+                entries: t.List[os.DirEntry] = [
+                    entry for entry in iterator if keep(entry)
+                ]
             else:
-                counts["files"] += 1
+                entries: t.List[os.DirEntry] = list(iterator)
+
+        entries.sort(key=lambda e: e.name.lower(), reverse=self.reverse)
+        return entries
+
+    def _scan(self, directory: str) -> t.Tuple[t.Tuple[int, int], t.List[EntryName]]:
+        """
+        Collect the EntryName for a directory's selected entries. Safe to run
+        from worker threads, as it neither counts entries nor touches the status.
+
+        :param directory: Directory path to scan
+        :return: Tuple of the directory's (device, inode) identity, and its
+        EntryName objects in sort order
+        """
+
+        st: os.stat_result = os.stat(directory)
+        return (st.st_dev, st.st_ino), [
+            EntryName(entry=entry, no_icons=self.no_icons)
+            for entry in self._select(directory=directory)
+        ]
+
+    def _entry_stats(self, entry: os.DirEntry) -> EntryStats:
+        """
+        Collect the EntryStats for a single directory entry.
+
+        :param entry: Directory entry to collect metadata for
+        :return: EntryStats object for the entry
+        """
+
+        # On Windows, DirEntry.stat() leaves st_ino, st_dev and st_nlink zeroed,
+        # so let EntryStats take a full lstat there instead
+        return EntryStats(
+            path=Path(entry.path),
+            dt_now=self.dt_now,
+            dt_format=self.dt_format,
+            no_icons=self.no_icons,
+            st=None if IS_WINDOWS else entry.stat(follow_symlinks=False),
+        )
+
+    def _count(self, entry: t.Union[EntryStats, EntryName]):
+        """
+        Tally a scanned entry under its kind, for the summary.
+
+        :param entry: EntryStats or EntryName object that was scanned
+        """
+
+        # Checked first, since a junction's stat mode is still S_IFDIR
+        if entry.mimetype == "inode/junction":
+            self.counts["junctions"] += 1
+        elif stat.S_ISDIR(entry.mode):
+            self.counts["directories"] += 1
+        elif stat.S_ISLNK(entry.mode):
+            self.counts["symlinks"] += 1
+        else:
+            self.counts["files"] += 1
+
+    def summary(self) -> str:
+        """
+        Generate a human-readable summary of the entries scanned so far.
+
+        :return: Human-readable summary string
+        """
+        counts: Counter[str] = self.counts
 
         parts: list[str] = []
         if counts["directories"]:
@@ -540,10 +956,14 @@ class EntryScanner:
                 f"{counts['junctions']} junction{'s' if counts['junctions'] != 1 else ''}"
             )
 
-        if len(parts) == 1:
+        if not parts:
+            summary_msg: str = "nothing"
+        elif len(parts) == 1:
             summary_msg: str = parts[0]
         else:
             summary_msg: str = ", ".join(parts[:-1]) + f", and {parts[-1]}"
 
+        import humanize
+
         elapsed: str = humanize.naturaldelta(datetime.now() - self.dt_now)
         return f"scanned {summary_msg} in {elapsed}."
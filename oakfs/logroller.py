@@ -5,7 +5,7 @@ from rich.panel import Panel
 
 from . import __project__
 
-__all__ = ["LogRoller", "console"]
+__all__ = ["LogRoller", "console", "log"]
 
 console = Console()
 
@@ -76,3 +76,6 @@ class LogRoller:
         """
 
         self._log(_type="summary", text=text)
+
+
+log = LogRoller()
@@ -1,9 +1,10 @@
 import os
+import stat
 import typing as t
 from datetime import datetime
 from pathlib import Path
 
-from rich import box, print
+from rich import box
 from rich.table import Table
 from rich.text import Text
 from rich.tree import Tree
@@ -13,14 +14,12 @@ from .filesystem import (
     EntryStats,
     ENTRY_STYLES,
     style_text,
-    _is_dir_no_follow,
 )
-from .logroller import LogRoller
+from .logroller import console, log
 
-__all__ = ["Oak", "log", "CWD"]
+__all__ = ["Oak", "log"]
 
-log = LogRoller()
-CWD = Path.cwd()
+STREAM_BATCH_SIZE = 256
 
 
 class Oak:
@@ -47,7 +46,7 @@ class Oak:
         :param symlinks_only: Show symlinks only
         :param junctions_only: Show junctions only (Windows)
         :param kwargs: Additional keyword arguments for configuration options such as table style,
-        datetime format, verbosity, and display of groups, owners, and permissions.
+        datetime format, verbosity, streaming, and display of groups, owners, and permissions.
         """
 
         self.path = path
@@ -60,6 +59,7 @@ class Oak:
 
         self.table_style = kwargs.get("table_style", "ROUNDED")
         self.stats: bool = kwargs.get("show_stats", False)
+        self.stream: bool = kwargs.get("stream", False)
 
         self.scanner = EntryScanner(
             path,
@@ -95,84 +95,105 @@ class Oak:
                 style=root_styles["style"],
             ),
             guide_style="dim",
-            highlight=True,
+            highlight=False,
         )
 
-        collected: list[EntryStats] = []
+        # The scanner walks sibling directories concurrently; the Rich tree is only
+        # built here, on the main thread, by attaching each directory's entries to
+        # the node that was created for it when its parent was listed.
+        nodes: dict[str, Tree] = {str(self.path): root_tree}
+        for directory, entries in self.scanner.walk(directory=self.path):
+            tree: Tree = nodes.pop(directory)
+            for entry in entries:
+                node: Tree = tree.add(entry.style_name())
+                if stat.S_ISDIR(entry.mode):
+                    nodes[str(entry.path)] = node
 
-        def add_nodes(directory: str, tree: Tree):
-            """
-            Recursively add nodes to the tree.
-
-            :param directory: string path of the directory to scan
-            :param tree: current Tree node to add entries to
-            """
-            for entry in self.scanner.entries(directory=directory):
-                collected.append(entry)
-                filename: Text = entry.style_name()
-
-                if _is_dir_no_follow(path=entry.path):
-                    branch = tree.add(filename)
-                    add_nodes(directory=str(entry.path), tree=branch)
-                else:
-                    tree.add(filename)
-
-        add_nodes(directory=str(self.path), tree=root_tree)
-        print(root_tree)
-        log.summary(self.scanner.summary(entries=collected))
+        console.print(root_tree)
+        log.summary(self.scanner.summary())
 
     def table(self):
         """
         Display the directory contents in a table.
         """
 
-        def make_table() -> Table:
+        def make_table(show_header: bool = True) -> Table:
+            # When streaming, each batch is printed as its own table, so column widths
+            # come from fixed ratios (not content) and outer edges are dropped to keep
+            # consecutive batches aligned as one continuous table.
+            def ratio(value: int) -> t.Optional[int]:
+                return value if self.stream else None
+
+            # Columns carry their own styles, so skip Rich's repr highlighter, which
+            # would otherwise run a regex pass over every string cell.
             table = Table(
-                show_header=True,
+                show_header=show_header,
                 header_style="bold",
                 box=getattr(box, self.table_style.upper()),
-                highlight=True,
+                highlight=False,
                 expand=True,
                 border_style="dim",
+                show_edge=not self.stream,
             )
 
-            table.add_column("name", overflow="ellipsis")
-            table.add_column("size", justify="right")
-            table.add_column("type", overflow="fold", style="dim #8BA2AD")
-            table.add_column("last seen", justify="right", style="italic")
-            table.add_column("updated", justify="right", style="italic")
+            table.add_column("name", overflow="ellipsis", ratio=ratio(3))
+            table.add_column("size", justify="right", style="cyan", ratio=ratio(1))
+            table.add_column(
+                "type", overflow="fold", style="dim #8BA2AD", ratio=ratio(2)
+            )
+            table.add_column(
+                "last seen", justify="right", style="italic", ratio=ratio(2)
+            )
+            table.add_column("updated", justify="right", style="italic", ratio=ratio(2))
 
             if self.stats:
-                table.add_column("mimetype", style="cyan")
-                table.add_column("inode")
-                table.add_column("hardlinks")
-                table.add_column("group", style="yellow")
-                table.add_column("owner", style="green")
-                table.add_column("permissions", style="bold red")
+                table.add_column("mimetype", style="cyan", ratio=ratio(2))
+                table.add_column("inode", ratio=ratio(1))
+                table.add_column("hardlinks", ratio=ratio(1))
+                table.add_column("group", style="yellow", ratio=ratio(1))
+                table.add_column("owner", style="green", ratio=ratio(1))
+                table.add_column("permissions", style="bold red", ratio=ratio(1))
 
             return table
 
-        entry_table: Table = make_table()
-        rows: list[EntryStats] = list(self.scanner.entries(directory=self.path))
-
-        for entry in rows:
-            row: list = [
+        def basic_row(entry: EntryStats) -> tuple:
+            return (
                 entry.style_name(),
                 entry.size.lower(),
                 entry.filetype.lower(),
                 entry.atime,
                 entry.mtime,
-            ]
+            )
 
-            if self.stats:
-                row.append(entry.mimetype)
-                row.append(str(entry.inode))
-                row.append(str(entry.hardlinks))
-                row.append(entry.group)
-                row.append(entry.owner)
-                row.append(entry.permissions)
+        def stats_row(entry: EntryStats) -> tuple:
+            return basic_row(entry) + (
+                entry.mimetype,
+                str(entry.inode),
+                str(entry.hardlinks),
+                entry.group,
+                entry.owner,
+                entry.permissions,
+            )
+
+        # The row shape is fixed for the whole table, so pick the builder once
+        build_row: t.Callable[[EntryStats], tuple] = (
+            stats_row if self.stats else basic_row
+        )
+
+        entry_table: Table = make_table()
+        entries: t.Iterable[EntryStats] = (
+            self.scanner.entries(directory=self.path)
+            if self.path.is_dir()
+            else [self.scanner.entry(path=self.path)]
+        )
+
+        for entry in entries:
+            entry_table.add_row(*build_row(entry))
 
-            entry_table.add_row(*row)
+            if self.stream and entry_table.row_count == STREAM_BATCH_SIZE:
+                console.print(entry_table)
+                entry_table = make_table(show_header=False)
 
-        print(entry_table)
-        log.summary(self.scanner.summary(entries=rows))
+        if entry_table.row_count or not self.stream:
+            console.print(entry_table)
+        log.summary(self.scanner.summary())